@@ -3,6 +3,9 @@
 import time
 import re
 
+# Sentence terminators used to split responses into video-loop chunks
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
 class LipSyncManager:
     """Manages timing between TTS voice and video lip movements"""
     
@@ -15,28 +18,40 @@ class LipSyncManager:
         self.base_wpm = 140  # News anchor speaking rate (slightly slower, more clear)
         self.min_wpm = 110   # Slowest comfortable rate
         self.max_wpm = 170   # Fastest comfortable rate
+        
+        # Rate and loop count depend only on word count - precompute for typical responses
+        self.max_table_words = 500
+        self._wpm_table = [self._compute_wpm(n) for n in range(self.max_table_words + 1)]
+        self._loops_table = [self._compute_loops(n) for n in range(self.max_table_words + 1)]
+    
+    @staticmethod
+    def _wc(text):
+        """Word count - one whitespace split per call, so newlines and repeated spaces count correctly"""
+        return len(text.split())
     
     def estimate_speech_duration(self, text):
         """Estimate how long it will take to speak the text"""
         # Count words
-        words = len(text.split())
+        words = self._wc(text)
         
         # Calculate duration at base rate (words per minute)
         duration_seconds = (words / self.base_wpm) * 60
         
         return duration_seconds
     
-    def calculate_optimal_rate(self, text):
-        """Calculate optimal TTS rate to match video timing"""
-        words = len(text.split())
-        
+    def _compute_loops(self, words):
+        """Number of talk video loops for a given word count"""
+        duration = (words / self.base_wpm) * 60
+        return max(1, round(duration / self.talk_video_duration))
+    
+    def _compute_wpm(self, words):
+        """Optimal TTS rate for a given word count"""
         # If very short response (1-5 words), use base rate
         if words <= 5:
             return self.base_wpm
         
         # Calculate how many video loops we need
-        estimated_duration = self.estimate_speech_duration(text)
-        num_loops = max(1, round(estimated_duration / self.talk_video_duration))
+        num_loops = self._compute_loops(words)
         
         # Target duration should be close to video loop timing
         target_duration = num_loops * self.talk_video_duration
@@ -49,34 +64,45 @@ class LipSyncManager:
         
         return int(optimal_wpm)
     
+    def calculate_optimal_rate(self, text):
+        """Calculate optimal TTS rate to match video timing"""
+        words = self._wc(text)
+        if words <= self.max_table_words:
+            return self._wpm_table[words]
+        return self._compute_wpm(words)
+    
     def get_video_loops_needed(self, text):
         """Calculate how many video loops are needed for this text"""
-        duration = self.estimate_speech_duration(text)
-        loops = max(1, round(duration / self.talk_video_duration))
-        return loops
+        words = self._wc(text)
+        if words <= self.max_table_words:
+            return self._loops_table[words]
+        return self._compute_loops(words)
     
     def split_text_for_natural_pauses(self, text):
         """Split text into chunks for natural pauses (matches video loops)"""
         # Split by sentences
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENT_SPLIT_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         chunks = []
-        current_chunk = ""
+        current_parts = []  # Sentences of the chunk being built, joined on flush
+        current_wc = 0
         
         for sentence in sentences:
-            test_chunk = current_chunk + " " + sentence if current_chunk else sentence
+            sentence_wc = self._wc(sentence)
             
             # If chunk is getting too long for one video loop, split it
-            if len(test_chunk.split()) > 15:  # ~15 words per loop
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
+            if current_wc + sentence_wc > 15:  # ~15 words per loop
+                if current_parts:
+                    chunks.append(' '.join(current_parts))
+                current_parts = [sentence]
+                current_wc = sentence_wc
             else:
-                current_chunk = test_chunk
+                current_parts.append(sentence)
+                current_wc += sentence_wc
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append(' '.join(current_parts))
         
         return chunks if chunks else [text]
 
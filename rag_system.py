@@ -2,48 +2,244 @@
 
 import os
 import re
-from PyPDF2 import PdfReader
+import hashlib
+import time
+import pickle
+import threading
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import pypdfium2 as pdfium
 import google.generativeai as genai
 from dotenv import load_dotenv
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_core.documents import Document
+import faiss
+import numpy as np
 
 load_dotenv()
 
+# Pre-compiled pattern for PDF text cleanup
+_WS_RE = re.compile(r'\s+')
+
+# Words for the keyword fallback search - the same pattern on the index and query side,
+# so punctuation never splits "budget?" from "budget."
+_TOKEN_RE = re.compile(r'\w+')
+
+# Common words ignored by the keyword fallback search
+_STOP_WORDS = frozenset({
+    'the', 'is', 'are', 'was', 'were', 'what', 'how', 'why', 'when', 'where', 'who', 'a', 'an', 'of', 'to'
+})
+
+# News introductions per language - Aaj Tak style (punchy, energetic)
+_INTROS = {
+    'english': "Welcome to news! Today's big story from official documents!",
+    'hindi': "नमस्कार! आज की बड़ी खबर आधिकारिक दस्तावेजों से!",
+    'marathi': "नमस्कार! आज ची मोठी बातमी अधिकृत कागदपत्रांमधून!",
+    'tamil': "வணக்கம்! அதிகாரப்பூர்வ ஆவணங்களிலிருந்து இன்றைய பெரிய செய்தி!",
+    'telugu': "నమస్కారం! అధికారిక పత్రాల నుండి నేటి పెద్ద వార్త!"
+}
+
+# Translation target names for Gemini prompts
+_LANG_NAMES = {
+    'hindi': 'Hindi',
+    'marathi': 'Marathi',
+    'tamil': 'Tamil',
+    'telugu': 'Telugu'
+}
+
+# Chunks per embedding request and number of requests kept in flight
+EMBED_BATCH_SIZE = 100
+EMBED_MAX_WORKERS = 8
+
+# Translation is sent as concurrent requests of roughly this many characters each
+TRANSLATION_SEGMENT_CHARS = 2000
+TRANSLATION_MAX_WORKERS = 5
+TRANSLATION_RETRIES = 3
+# Output budget per segment - Indic scripts take several tokens per English word
+TRANSLATION_MAX_OUTPUT_TOKENS = 8192
+# A segment cut off at the budget is re-sent in halves, down to this many characters
+TRANSLATION_MIN_SPLIT_CHARS = 200
+
+# HNSW graph for typical documents; switch to IVF-PQ (compressed 8-bit codes) above this size
+IVFPQ_MIN_CHUNKS = 10000
+
+# Answered questions kept for reuse; a new question whose embedding has at least this
+# cosine similarity to a cached one gets the cached answer
+QA_CACHE_SIZE = 128
+QA_SEMANTIC_THRESHOLD = 0.95
+
+# Processed text and FAISS indexes are cached here, keyed by a hash of the PDF bytes
+CACHE_DIR = os.getenv('RAG_CACHE_DIR', '.cache')
+# Part of every cache key - bump when extraction, translation, chunking, sentence
+# storage or index parameters change, so stale caches are rebuilt instead of loaded
+CACHE_FORMAT_VERSION = 1
+
+
+def _scan_sentences(text, min_words=5):
+    """Single pass over whitespace-normalized text, yielding (start, end) spans of
+    sentences ending in . ! or ? followed by a space. Words are counted inline so
+    fragments shorter than min_words can be dropped without re-splitting each sentence."""
+    start = 0
+    words = 1
+    last = len(text) - 1
+    for i, ch in enumerate(text):
+        if ch == ' ':
+            if i < last and text[i - 1] in '.!?':
+                if words >= min_words:
+                    yield start, i
+                start = i + 1
+                words = 1
+            else:
+                words += 1
+    if start <= last and words >= min_words:
+        yield start, last + 1
+
+
+class SentenceBuffer:
+    """Read-only sequence of sentences stored as offsets into one text buffer
+    instead of one Python string per sentence"""
+    
+    def __init__(self, text, spans):
+        self.text = text
+        spans = np.array(spans, dtype=np.int32).reshape(-1, 2)
+        self.starts = np.ascontiguousarray(spans[:, 0])
+        self.ends = np.ascontiguousarray(spans[:, 1])
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def __getitem__(self, index):
+        return self.text[self.starts[index]:self.ends[index]]
+    
+    def __iter__(self):
+        text = self.text
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield text[start:end]
+    
+    def text_from(self, index):
+        """Document text from sentence index to the last sentence, as a single slice"""
+        if index >= len(self.starts):
+            return ""
+        return self.text[self.starts[index]:self.ends[-1]]
+
+
+def _extract_pages(pdf):
+    """Extract the raw text of every page of an open PDFium document"""
+    texts = []
+    for page in pdf:
+        textpage = page.get_textpage()
+        texts.append(textpage.get_text_range())
+        textpage.close()
+        page.close()
+    return texts
+
+
+def _split_for_translation(text, max_chars=TRANSLATION_SEGMENT_CHARS):
+    """Split text into segments of at most max_chars, breaking after a sentence where possible"""
+    segments = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + max_chars, length)
+        if end < length:
+            # Prefer the last sentence end, then the last space, inside the window
+            cut = max(text.rfind('. ', start, end), text.rfind('! ', start, end), text.rfind('? ', start, end))
+            if cut == -1:
+                cut = text.rfind(' ', start, end)
+            if cut > start:
+                end = cut + 1
+        segment = text[start:end].strip()
+        if segment:
+            segments.append(segment)
+        start = end
+    return segments
+
+
+def _fast_chunk(text, size=1000, overlap=200):
+    """Split text into chunks of at most size characters overlapping by about overlap,
+    ending each chunk after the last sentence (or word) in its final overlap-sized window"""
+    chunks = []
+    length = len(text)
+    start = 0
+    while start < length:
+        end = min(start + size, length)
+        if end < length:
+            window_start = max(start + 1, end - overlap)
+            cut = text.rfind('. ', window_start, end)
+            if cut != -1:
+                end = cut + 1
+            else:
+                cut = text.rfind(' ', window_start, end)
+                if cut != -1:
+                    end = cut
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= length:
+            break
+        # Step back by the overlap to a word boundary, but always make progress
+        start = max(end - overlap, start + 1)
+        space = text.find(' ', start, end)
+        if space != -1:
+            start = space + 1
+    return chunks
+
+
 class NewsReadingSystem:
     def __init__(self, pdf_path, language='english'):
         self.pdf_path = pdf_path
         self.language = language
         self.pdf_text = ""
         self.translated_text = ""  # Store translated content
-        self.sentences = []
+        self.sentences = SentenceBuffer("", [])
         self.current_position = 0
         self.chunks = []
         self.model = None
         self.tts_model = None
         self.vector_store = None  # LangChain FAISS vector store
         self.embeddings = None
+        self.pdf_hash = None
+        # Inverted index in CSR form: chunk ids for token t are postings[offsets[t]:offsets[t + 1]]
+        self.vocab_id = {}
+        self.postings_offsets = np.zeros(1, dtype=np.int32)
+        self.postings = np.zeros(0, dtype=np.int32)
+        # Demo UIs repeat questions, so query tokenization is memoized per instance
+        self.query_word_ids = lru_cache(maxsize=256)(self._query_word_ids)
+        # Answer caches - exact (normalized question -> answer) and semantic (question embeddings)
+        # One lock for both, since Socket.IO handler threads ask concurrently
+        self.qa_cache_lock = threading.Lock()
+        self.qa_cache = OrderedDict()
+        self.qa_semantic_index = None
+        self.qa_semantic_answers = []
         self.setup()
     
     def extract_text_from_pdf(self):
         """Extract text from PDF with better formatting - remove extra line breaks"""
         print(f"📄 Reading PDF: {self.pdf_path}")
         try:
-            reader = PdfReader(self.pdf_path)
-            text = ""
-            for page_num, page in enumerate(reader.pages, 1):
-                page_text = page.extract_text()
+            # Native PDFium extraction, in-process
+            pdf = pdfium.PdfDocument(self.pdf_path)
+            try:
+                page_count = len(pdf)
+                page_texts = _extract_pages(pdf)
+            finally:
+                pdf.close()
+            
+            parts = []
+            for page_text in page_texts:
                 if page_text:
-                    # Clean the text: remove excessive line breaks and spaces
-                    page_text = page_text.replace('\n', ' ').replace('\r', ' ')
-                    # Remove multiple spaces
-                    page_text = ' '.join(page_text.split())
-                    text += page_text + " "
+                    # Clean the text: collapse line breaks, tabs and runs of spaces in one pass
+                    page_text = _WS_RE.sub(' ', page_text).strip()
+                    if page_text:
+                        parts.append(page_text)
             
-            print(f"✅ Extracted {len(text)} characters from {len(reader.pages)} pages")
-            return text.strip()
+            # Join once instead of growing a string page by page
+            text = ' '.join(parts)
+            print(f"✅ Extracted {len(text)} characters from {page_count} pages")
+            return text
         except Exception as e:
             print(f"❌ PDF extraction error: {e}")
             raise
@@ -51,115 +247,202 @@ class NewsReadingSystem:
     def split_into_sentences(self, text):
         """Split text into sentences for smooth news reading"""
         # Clean text first - remove extra spaces
-        text = ' '.join(text.split())
+        text = _WS_RE.sub(' ', text).strip()
         
-        # Split by sentence endings (., !, ?)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        # Filter and clean sentences
-        formatted_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            # Only keep sentences with at least 5 words (avoid fragments)
-            if sentence and len(sentence.split()) >= 5:
-                formatted_sentences.append(sentence)
+        # Split by sentence endings (., !, ?), keeping only sentences with at
+        # least 5 words (avoid fragments)
+        formatted_sentences = SentenceBuffer(text, list(_scan_sentences(text)))
         
         print(f"✅ Split into {len(formatted_sentences)} sentences for reading")
         return formatted_sentences
     
+    def translate_segment(self, segment, target_lang):
+        """Translate one segment with Gemini, backing off and retrying on errors such as rate limits"""
+        prompt = f"""Translate the following English text to {target_lang}. 
+            
+Maintain the same meaning, structure, and professional tone. 
+Translate naturally as it would appear in official documents in {target_lang}.
+
+Text to translate:
+{segment}
+
+Translation:"""
+        
+        for attempt in range(TRANSLATION_RETRIES):
+            try:
+                response = self.model.generate_content(
+                    prompt,
+                    generation_config={
+                        'temperature': 0.2,
+                        'max_output_tokens': TRANSLATION_MAX_OUTPUT_TOKENS,
+                    }
+                )
+                finish_reason = response.candidates[0].finish_reason
+                truncated = getattr(finish_reason, 'name', finish_reason) == 'MAX_TOKENS'
+                if not truncated:
+                    return response.text.strip()
+            except Exception as e:
+                if attempt == TRANSLATION_RETRIES - 1:
+                    raise
+                delay = 2 ** attempt
+                print(f"⚠️ Translation segment failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
+                continue
+            
+            # Cut off at the output budget - translate the halves separately instead
+            if len(segment) < TRANSLATION_MIN_SPLIT_CHARS:
+                raise ValueError("translation truncated at the output token limit")
+            print(f"⚠️ Translation segment truncated, splitting {len(segment)} characters in half")
+            halves = _split_for_translation(segment, len(segment) // 2 + 1)
+            return ' '.join(self.translate_segment(half, target_lang) for half in halves)
+    
     def translate_text(self, text, target_language):
-        """Translate text to target language using Gemini"""
+        """Translate text to target language using Gemini - returns (text, fully_translated)"""
         if target_language == 'english':
-            return text
+            return text, True
         
         try:
             print(f"🌐 Translating document to {target_language}...")
             
-            lang_names = {
-                'hindi': 'Hindi',
-                'marathi': 'Marathi',
-                'tamil': 'Tamil',
-                'telugu': 'Telugu'
-            }
+            target_lang = _LANG_NAMES.get(target_language, 'Hindi')
             
-            target_lang = lang_names.get(target_language, 'Hindi')
+            failed = []
             
-            prompt = f"""Translate the following English text to {target_lang}. 
-            
-Maintain the same meaning, structure, and professional tone. 
-Translate naturally as it would appear in official documents in {target_lang}.
-
-Text to translate:
-{text}
-
-Translation:"""
+            def translate_or_keep(segment):
+                # A segment that still fails after retries stays in English on its own
+                try:
+                    return self.translate_segment(segment, target_lang)
+                except Exception as e:
+                    print(f"⚠️ Translation segment error: {e}, keeping original segment")
+                    failed.append(segment)
+                    return segment
             
-            response = self.model.generate_content(prompt)
-            translated = response.text.strip()
+            # Translate segments concurrently - each request is small and they overlap in flight
+            segments = _split_for_translation(text)
+            with ThreadPoolExecutor(max_workers=TRANSLATION_MAX_WORKERS) as executor:
+                translated_segments = list(executor.map(translate_or_keep, segments))
+            translated = ' '.join(translated_segments)
             
-            print(f"✅ Document translated to {target_language}")
-            return translated
+            if failed:
+                print(f"⚠️ Document translated to {target_language} with {len(failed)}/{len(segments)} segments left in English")
+            else:
+                print(f"✅ Document translated to {target_language} ({len(segments)} segments)")
+            return translated, not failed
             
         except Exception as e:
             print(f"⚠️ Translation error: {e}, using original text")
-            return text
+            return text, False
     
     def chunk_text(self, text, chunk_size=1000, overlap=200):
-        """Split text into overlapping chunks using LangChain for Q&A context"""
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
-        
-        chunks = text_splitter.split_text(text)
-        print(f"✅ Created {len(chunks)} text chunks with LangChain for Q&A")
+        """Split text into overlapping chunks for Q&A context"""
+        chunks = _fast_chunk(text, chunk_size, overlap)
+        print(f"✅ Created {len(chunks)} text chunks for Q&A")
         return chunks
     
+    def embed_chunks(self, texts, batch_size=EMBED_BATCH_SIZE):
+        """Embed chunks with one API call per batch, issuing batches concurrently"""
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            return self.embeddings.embed_documents(texts)
+        
+        with ThreadPoolExecutor(max_workers=min(EMBED_MAX_WORKERS, len(batches))) as executor:
+            results = list(executor.map(self.embeddings.embed_documents, batches))
+        
+        vectors = [vector for batch in results for vector in batch]
+        print(f"✅ Embedded {len(vectors)} chunks in {len(batches)} batched requests")
+        return vectors
+    
+    def build_vector_store(self, vectors):
+        """Build the FAISS store over chunk vectors using an approximate index instead of a flat scan"""
+        matrix = np.asarray(vectors, dtype='float32')
+        dim = matrix.shape[1]
+        
+        if len(matrix) >= IVFPQ_MIN_CHUNKS and dim % 16 == 0:
+            # Large corpus: product-quantize to 16 x 8-bit codes per vector
+            quantizer = faiss.IndexFlatL2(dim)
+            index = faiss.IndexIVFPQ(quantizer, dim, 64, 16, 8)
+            index.train(matrix)
+            index.nprobe = 8
+            print(f"🔍 Using IVF-PQ index for {len(matrix)} chunks")
+        else:
+            # Small corpus: HNSW graph search, full-precision vectors
+            index = faiss.IndexHNSWFlat(dim, 32)
+        index.add(matrix)
+        
+        docstore = InMemoryDocstore({
+            str(i): Document(page_content=chunk) for i, chunk in enumerate(self.chunks)
+        })
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id={i: str(i) for i in range(len(self.chunks))},
+        )
+    
     def format_as_news(self, text):
         """Format text for news reading"""
         # Add news introduction
         intro = "Hello! I am your news anchor. Today we have new topics to discuss from official documents. Let's begin."
         return intro, text
     
-    def find_relevant_chunks(self, question, top_k=5):
+    def build_keyword_index(self):
+        """Build token -> chunk ids inverted index for the keyword fallback search"""
+        index = defaultdict(list)
+        for chunk_id, chunk in enumerate(self.chunks):
+            for token in set(_TOKEN_RE.findall(chunk.casefold())) - _STOP_WORDS:
+                index[token].append(chunk_id)
+        
+        # Flatten into contiguous int32 arrays so scoring runs as numpy ops
+        self.vocab_id = {token: i for i, token in enumerate(index)}
+        lengths = np.fromiter((len(ids) for ids in index.values()), dtype=np.int32, count=len(index))
+        self.postings_offsets = np.zeros(len(index) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=self.postings_offsets[1:])
+        self.postings = np.fromiter(
+            (chunk_id for ids in index.values() for chunk_id in ids),
+            dtype=np.int32, count=int(self.postings_offsets[-1])
+        )
+        self.query_word_ids.cache_clear()
+    
+    def _query_word_ids(self, question):
+        """Ids of indexed question words - stop words are never indexed, so they drop out here"""
+        vocab_id = self.vocab_id
+        return tuple({vocab_id[word] for word in _TOKEN_RE.findall(question.casefold()) if word in vocab_id})
+    
+    def score_keyword_matches(self, word_ids, top_k):
+        """Return ids of the top_k chunks matching the most query words, best first"""
+        if not word_ids:
+            return []
+        offsets = self.postings_offsets
+        hits = np.concatenate([self.postings[offsets[i]:offsets[i + 1]] for i in word_ids])
+        scores = np.bincount(hits, minlength=len(self.chunks)) * 3  # 3 points per matched word
+        
+        # Unique rank per chunk: higher score first, earlier chunk first on ties
+        matched = np.flatnonzero(scores)
+        n_chunks = len(self.chunks)
+        rank = scores[matched].astype(np.int64) * n_chunks + (n_chunks - 1 - matched)
+        if len(matched) > top_k:
+            top = np.argpartition(rank, -top_k)[-top_k:]
+            matched, rank = matched[top], rank[top]
+        return matched[np.argsort(-rank)].tolist()
+    
+    def find_relevant_chunks(self, question, top_k=5, query_vector=None):
         """Use LangChain FAISS vector store for semantic search with enhanced keyword fallback"""
         try:
             if self.vector_store:
                 # Semantic search using FAISS - get more chunks for better context
-                docs = self.vector_store.similarity_search(question, k=top_k)
+                if query_vector is not None:
+                    docs = self.vector_store.similarity_search_by_vector(query_vector, k=top_k)
+                else:
+                    docs = self.vector_store.similarity_search(question, k=top_k)
                 relevant_chunks = [doc.page_content for doc in docs]
                 print(f"🔍 LangChain semantic search found {len(relevant_chunks)} relevant chunks")
                 return relevant_chunks
             else:
                 # Enhanced keyword matching fallback
                 print("⚠️ Vector store not available, using enhanced keyword matching")
-                question_lower = question.lower()
-                question_words = set(question_lower.split())
-                
-                # Remove common stop words
-                stop_words = {'the', 'is', 'are', 'was', 'were', 'what', 'how', 'why', 'when', 'where', 'who', 'a', 'an', 'of', 'to'}
-                question_words = question_words - stop_words
-                
-                scored_chunks = []
-                
-                for chunk in self.chunks:
-                    chunk_lower = chunk.lower()
-                    score = 0
-                    
-                    # Score based on word matches and partial matches
-                    for word in question_words:
-                        if word in chunk_lower:
-                            score += 3  # Full word match
-                        elif any(word in chunk_word for chunk_word in chunk_lower.split()):
-                            score += 1  # Partial match
-                    
-                    if score > 0:
-                        scored_chunks.append((score, chunk))
-                
-                scored_chunks.sort(reverse=True, key=lambda x: x[0])
-                relevant_chunks = [chunk for _, chunk in scored_chunks[:top_k]]
+                # Score chunks by question words they contain, via the inverted index
+                word_ids = self.query_word_ids(question)
+                relevant_chunks = [self.chunks[chunk_id] for chunk_id in self.score_keyword_matches(word_ids, top_k)]
                 
                 # If no matches found, return first few chunks as fallback
                 if not relevant_chunks:
@@ -173,11 +456,76 @@ Translation:"""
             print(f"❌ Semantic search error: {e}")
             return self.chunks[:top_k] if self.chunks else []
     
+    def hash_pdf(self):
+        """Hash the PDF bytes so cached results are tied to this exact document"""
+        with open(self.pdf_path, 'rb') as f:
+            return hashlib.blake2b(f.read()).hexdigest()[:16]
+    
+    def cache_path(self, name):
+        """Path of a cache entry for the current PDF"""
+        return os.path.join(CACHE_DIR, f"{name}_v{CACHE_FORMAT_VERSION}_{self.pdf_hash}")
+    
+    def load_text_cache(self):
+        """Load extracted/translated text, sentences and chunks for this PDF and language"""
+        path = self.cache_path(f"text_{self.language}") + ".pkl"
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+            self.pdf_text = cached['pdf_text']
+            self.translated_text = cached['translated_text']
+            if not isinstance(cached['sentences'], SentenceBuffer):
+                print("⚠️ Text cache uses an old format, rebuilding")
+                return False
+            self.sentences = cached['sentences']
+            self.chunks = cached['chunks']
+            print(f"✅ Loaded {len(self.sentences)} sentences and {len(self.chunks)} chunks from cache")
+            return True
+        except Exception as e:
+            print(f"⚠️ Text cache unreadable, rebuilding: {e}")
+            return False
+    
+    def save_text_cache(self):
+        """Persist processed text so restarts skip extraction and translation"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self.cache_path(f"text_{self.language}") + ".pkl", 'wb') as f:
+                pickle.dump({
+                    'pdf_text': self.pdf_text,
+                    'translated_text': self.translated_text,
+                    'sentences': self.sentences,
+                    'chunks': self.chunks,
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ Could not write text cache: {e}")
+    
+    def load_vector_store(self):
+        """Load a previously saved FAISS index for this PDF, if any"""
+        path = self.cache_path("faiss")
+        if not os.path.isdir(path):
+            return None
+        try:
+            # The index was written by save_local below, so unpickling it is safe
+            vector_store = FAISS.load_local(
+                path, self.embeddings, allow_dangerous_deserialization=True
+            )
+            print("✅ Loaded FAISS vector store from cache")
+            return vector_store
+        except Exception as e:
+            print(f"⚠️ FAISS cache unreadable, rebuilding: {e}")
+            return None
+    
     def setup(self):
         """Setup news reading system with Q&A using LangChain"""
         try:
+            # Hash PDF so processed text and embeddings can be reused across restarts
+            self.pdf_hash = self.hash_pdf()
+            text_cached = self.load_text_cache()
+            
             # Extract PDF text
-            self.pdf_text = self.extract_text_from_pdf()
+            if not text_cached:
+                self.pdf_text = self.extract_text_from_pdf()
             
             # Setup Gemini with retry
             api_key = os.getenv('GOOGLE_API_KEY')
@@ -196,18 +544,28 @@ Translation:"""
                 }
             )
             
-            # Translate content if needed
-            if self.language != 'english':
-                self.translated_text = self.translate_text(self.pdf_text, self.language)
-                working_text = self.translated_text
-            else:
-                working_text = self.pdf_text
-            
-            # Split into sentences for reading (use translated text)
-            self.sentences = self.split_into_sentences(working_text)
+            if not text_cached:
+                # Translate content if needed
+                fully_translated = True
+                if self.language != 'english':
+                    self.translated_text, fully_translated = self.translate_text(self.pdf_text, self.language)
+                    working_text = self.translated_text
+                else:
+                    working_text = self.pdf_text
+                
+                # Split into sentences for reading (use translated text)
+                self.sentences = self.split_into_sentences(working_text)
+                
+                # Create chunks for Q&A using original English text
+                self.chunks = self.chunk_text(self.pdf_text)
+                
+                # Never cache a partial translation, so the next start retries it
+                if fully_translated:
+                    self.save_text_cache()
+                else:
+                    print("⚠️ Translation incomplete - text cache not saved")
             
-            # Create chunks for Q&A using original English text
-            self.chunks = self.chunk_text(self.pdf_text)
+            self.build_keyword_index()
             
             # Initialize LangChain embeddings and FAISS vector store
             try:
@@ -217,11 +575,16 @@ Translation:"""
                     google_api_key=api_key
                 )
                 
-                # Create documents for vector store
-                documents = [Document(page_content=chunk) for chunk in self.chunks]
-                
-                # Create FAISS vector store
-                self.vector_store = FAISS.from_documents(documents, self.embeddings)
+                # Reuse the saved index when this PDF has been embedded before
+                self.vector_store = self.load_vector_store()
+                if self.vector_store is None:
+                    # Embed all chunks in batched requests, then build FAISS from the vectors
+                    vectors = self.embed_chunks(self.chunks)
+                    self.vector_store = self.build_vector_store(vectors)
+                    try:
+                        self.vector_store.save_local(self.cache_path("faiss"))
+                    except Exception as e:
+                        print(f"⚠️ Could not write FAISS cache: {e}")
                 print("✅ LangChain FAISS vector store ready for semantic search!")
             except Exception as e:
                 print(f"⚠️ LangChain setup warning: {e}")
@@ -236,14 +599,7 @@ Translation:"""
     
     def get_news_intro(self, language='english'):
         """Get news introduction in selected language - Aaj Tak style (punchy, energetic)"""
-        intros = {
-            'english': "Welcome to news! Today's big story from official documents!",
-            'hindi': "नमस्कार! आज की बड़ी खबर आधिकारिक दस्तावेजों से!",
-            'marathi': "नमस्कार! आज ची मोठी बातमी अधिकृत कागदपत्रांमधून!",
-            'tamil': "வணக்கம்! அதிகாரப்பூர்வ ஆவணங்களிலிருந்து இன்றைய பெரிய செய்தி!",
-            'telugu': "నమస్కారం! అధికారిక పత్రాల నుండి నేటి పెద్ద వార్త!"
-        }
-        return intros.get(language.lower(), intros['english'])
+        return _INTROS.get(language.lower(), _INTROS['english'])
     
     def get_next_sentence(self):
         """Get next sentence for reading"""
@@ -253,11 +609,15 @@ Translation:"""
             return sentence, self.current_position < len(self.sentences)
         return None, False
     
+    def peek_next_sentence(self):
+        """Get the sentence get_next_sentence() will return next, without advancing"""
+        if self.current_position < len(self.sentences):
+            return self.sentences[self.current_position]
+        return None
+    
     def get_remaining_text(self):
         """Get all remaining text from current position"""
-        if self.current_position < len(self.sentences):
-            return ' '.join(self.sentences[self.current_position:])
-        return ""
+        return self.sentences.text_from(self.current_position)
     
     def reset_position(self):
         """Reset reading position to start"""
@@ -269,6 +629,64 @@ Translation:"""
             return (self.current_position / len(self.sentences)) * 100
         return 0
     
+    def embed_question(self, question):
+        """Embed a question once for both the answer cache and the vector search"""
+        if not self.vector_store:
+            return None
+        try:
+            return self.embeddings.embed_query(question)
+        except Exception as e:
+            print(f"⚠️ Question embedding error: {e}")
+            return None
+    
+    def get_cached_answer(self, key):
+        """Return the cached answer for this normalized question, if any"""
+        with self.qa_cache_lock:
+            answer = self.qa_cache.get(key)
+            if answer is not None:
+                self.qa_cache.move_to_end(key)
+        if answer is not None:
+            print("⚡ Answer served from cache")
+        return answer
+    
+    def get_similar_answer(self, query_vector):
+        """Return the cached answer of a near-identical earlier question, if any"""
+        if query_vector is None:
+            return None
+        vector = np.asarray([query_vector], dtype='float32')
+        faiss.normalize_L2(vector)
+        with self.qa_cache_lock:
+            # Search and lookup under the lock so an eviction cannot shift positions in between
+            if not self.qa_semantic_answers:
+                return None
+            similarity, position = self.qa_semantic_index.search(vector, 1)
+            if similarity[0][0] < QA_SEMANTIC_THRESHOLD:
+                return None
+            answer = self.qa_semantic_answers[position[0][0]]
+        print(f"⚡ Answer served from cache (similar question, cosine {similarity[0][0]:.2f})")
+        return answer
+    
+    def cache_answer(self, key, query_vector, answer):
+        """Remember an answer by normalized question text and by question embedding"""
+        with self.qa_cache_lock:
+            self.qa_cache[key] = answer
+            if len(self.qa_cache) > QA_CACHE_SIZE:
+                self.qa_cache.popitem(last=False)
+        
+        if query_vector is None:
+            return
+        vector = np.asarray([query_vector], dtype='float32')
+        faiss.normalize_L2(vector)
+        with self.qa_cache_lock:
+            if self.qa_semantic_index is None:
+                self.qa_semantic_index = faiss.IndexFlatIP(vector.shape[1])
+            if len(self.qa_semantic_answers) >= QA_CACHE_SIZE:
+                # Drop the oldest entry; IndexFlat compacts ids so positions stay aligned
+                self.qa_semantic_index.remove_ids(np.array([0], dtype='int64'))
+                self.qa_semantic_answers.pop(0)
+            self.qa_semantic_index.add(vector)
+            self.qa_semantic_answers.append(answer)
+    
     def ask_question(self, question):
         """Ask a question about the PDF with intelligent analysis and complete answers"""
         try:
@@ -277,8 +695,20 @@ Translation:"""
             
             print(f"📋 Analyzing question: {question}")
             
+            # Repeated (or near-identical) questions skip retrieval and generation
+            cache_key = question.strip().casefold()
+            cached_answer = self.get_cached_answer(cache_key)
+            if cached_answer is not None:
+                return cached_answer
+            
+            query_vector = self.embed_question(question)
+            cached_answer = self.get_similar_answer(query_vector)
+            if cached_answer is not None:
+                self.cache_answer(cache_key, None, cached_answer)
+                return cached_answer
+            
             # Find relevant chunks with more context (top_k=5)
-            relevant_chunks = self.find_relevant_chunks(question, top_k=5)
+            relevant_chunks = self.find_relevant_chunks(question, top_k=5, query_vector=query_vector)
             
             if not relevant_chunks:
                 return "I don't have information about that in the current document."
@@ -320,6 +750,7 @@ Your complete answer:"""
             
             answer = response.text.strip()
             print(f"✅ Answer generated successfully")
+            self.cache_answer(cache_key, query_vector, answer)
             return answer
             
         except Exception as e:
@@ -381,6 +812,20 @@ def get_next_sentence():
         return news_system.get_next_sentence()
     return None, False
 
+def peek_next_sentence():
+    """Get next sentence without advancing the reading position"""
+    global news_system
+    if news_system:
+        return news_system.peek_next_sentence()
+    return None
+
+def get_all_sentences():
+    """Get every reading sentence, in order"""
+    global news_system
+    if news_system:
+        return list(news_system.sentences)
+    return []
+
 def get_remaining_text():
     """Get remaining news text"""
     global news_system
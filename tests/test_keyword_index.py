@@ -0,0 +1,28 @@
+import pytest
+
+rag_system = pytest.importorskip("rag_system")
+
+
+def make_system(chunks):
+    # Skip setup(): the keyword index only needs the chunks
+    system = rag_system.NewsReadingSystem.__new__(rag_system.NewsReadingSystem)
+    system.chunks = chunks
+    system.query_word_ids = rag_system.lru_cache(maxsize=256)(system._query_word_ids)
+    system.build_keyword_index()
+    return system
+
+
+def test_question_punctuation_matches_chunk_punctuation():
+    system = make_system([
+        "Nothing relevant here.",
+        "The state budget. It was approved, budget, in March.",
+    ])
+    word_ids = system.query_word_ids("What is the budget?")
+    assert word_ids
+    assert system.score_keyword_matches(word_ids, top_k=5) == [1]
+
+
+def test_stop_words_are_not_indexed():
+    system = make_system(["What is the plan?"])
+    assert "the" not in system.vocab_id
+    assert "plan" in system.vocab_id
@@ -7,18 +7,26 @@ Multi-language support: English, Hindi, Marathi
 
 import speech_recognition as sr
 import os
+import edge_tts
+import miniaudio
+import numpy as np
+import sounddevice as sd
 from dotenv import load_dotenv
 import google.generativeai as genai
-import tempfile
-import io
 from prompts import AGENT_INSTRUCTION
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit
 import threading
-import time
+import asyncio
+import hashlib
+import json
+import queue
+import re
+from collections import OrderedDict
 from rag_system import (
     initialize_rag, ask_pdf_question, get_news_intro, 
-    get_next_sentence, get_remaining_text, reset_reading, get_progress, NewsReadingSystem
+    get_next_sentence, peek_next_sentence, get_all_sentences, get_remaining_text, reset_reading,
+    get_progress, NewsReadingSystem
 )
 from lip_sync_manager import lip_sync_manager
 import logging
@@ -34,14 +42,124 @@ logging.basicConfig(
 # Web server setup
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'news-reading-system'
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Local speech recognition when faster-whisper is installed, Google Web Speech otherwise
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'small')
+WHISPER_SAMPLE_RATE = 16000
+
+# Faster JSON for Socket.IO payloads when orjson is installed
+try:
+    import orjson
+    
+    class OrjsonCodec:
+        """json-module shaped wrapper - python-socketio expects dumps() to return str"""
+        
+        @staticmethod
+        def dumps(obj, *args, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+        
+        @staticmethod
+        def loads(data, *args, **kwargs):
+            return orjson.loads(data)
+    
+    socketio_json = OrjsonCodec
+except ImportError:
+    import json as socketio_json
+
+# Threading mode on purpose: TTS playback, gRPC Gemini calls and the Edge TTS event loop
+# thread all block natively and would stall a monkey-patched eventlet/gevent hub
+socketio = SocketIO(app, async_mode='threading', json=socketio_json, cors_allowed_origins="*")
+
+# Edge TTS (Microsoft) voice and prosody per language as (voice, rate, pitch, volume),
+# indexed by LANG_IDX - Indian female voices with energetic & animated delivery
+# - Fast rate for exciting moments (+15%)
+# - Higher pitch for enthusiasm (+5Hz)
+# - Stronger volume for presence (+13%)
+LANGUAGES = ('english', 'hindi', 'marathi', 'tamil', 'telugu')
+LANG_IDX = {language: i for i, language in enumerate(LANGUAGES)}
+VOICE_CFG = (
+    ('en-IN-NeerjaNeural', '+15%', '+5Hz', '+13%'),   # Indian English Female
+    ('hi-IN-SwaraNeural', '+15%', '+5Hz', '+13%'),    # Hindi Female
+    ('mr-IN-AarohiNeural', '+15%', '+5Hz', '+13%'),   # Marathi Female
+    ('ta-IN-PallaviNeural', '+15%', '+5Hz', '+13%'),  # Tamil Female
+    ('te-IN-ShrutiNeural', '+15%', '+5Hz', '+13%'),   # Telugu Female
+)
+# edge_tts.Communicate keyword arguments per voice config, built once instead of per sentence
+COMMUNICATE_KWARGS = {
+    cfg: {'voice': cfg[0], 'rate': cfg[1], 'pitch': cfg[2], 'volume': cfg[3]}
+    for cfg in VOICE_CFG
+}
+
+# Synthesized speech cache - in-memory LRU in front of MP3 files on disk
+TTS_MEMORY_CACHE_SIZE = 256
+TTS_CACHE_DIR = os.getenv(
+    'TTS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'news-anchor', 'tts')
+)
+# Disk tier cap; least recently used files are pruned down to TTS_DISK_CACHE_PRUNE_TO of it
+TTS_DISK_CACHE_MAX_MB = int(os.getenv('TTS_DISK_CACHE_MAX_MB', '200'))
+TTS_DISK_CACHE_PRUNE_TO = 0.8
+
+# Concurrent Edge TTS requests when pre-rendering a whole document (stays under throttling)
+TTS_PRERENDER_CONCURRENCY = 8
+
+# Edge TTS output (audio-24khz-48kbitrate-mono-mp3) is decoded once to PCM at this format
+TTS_SAMPLE_RATE = 24000
+TTS_CHANNELS = 1
+
+# Microphone energy threshold measured on first run, reused on later starts
+MIC_CALIBRATION_PATH = os.getenv('MIC_CALIBRATION_PATH', os.path.join('.cache', 'mic.json'))
+
+# Asked after every answer to resume the broadcast
+CONTINUE_PROMPTS = {
+    'english': 'Can we continue with the news?',
+    'hindi': 'क्या हम समाचार जारी रखें?',
+    'marathi': 'आम्ही बातम्या सुरू ठेवू का?'
+}
+
+# Small-talk phrases, matched against whole words (and word pairs) of the input
+GREET = frozenset({'hello', 'hi', 'hey', 'good morning', 'good evening'})
+THANKS = frozenset({'thank', 'thanks'})
+BYE = frozenset({'bye', 'goodbye', 'see you'})
+EXIT_WORDS = frozenset({'stop', 'quit', 'exit', 'goodbye'})
+
+# Canned replies for small talk, checked in this order before falling back to the document
+INTENT_RESPONSES = (
+    (GREET, "Good evening! Welcome to the news desk. I'm here to help you with information from official documents. What would you like to know today?"),
+    (THANKS, "You're very welcome! I'm here if you need any more information. Have a great day!"),
+    (BYE, "Thank you for tuning in! Stay informed and have a wonderful day ahead!"),
+)
+_WORD_RE = re.compile(r"[a-z']+")
+
+# Words of a transcript (any script), for spotting the anchor's own voice picked up by the mic
+_SPOKEN_WORD_RE = re.compile(r'\w+')
+ECHO_OVERLAP = 0.6  # Share of a phrase's word pairs found in the current speech that marks it an echo
+
+def word_pairs(text):
+    """Set of adjacent word pairs in text, in any script"""
+    words = _SPOKEN_WORD_RE.findall(text.lower())
+    return frozenset(zip(words, words[1:]))
+
+def tokenize(text):
+    """Lowercase words plus adjacent word pairs, so two-word phrases match by set lookup"""
+    words = _WORD_RE.findall(text.lower())
+    tokens = set(words)
+    tokens.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+    return tokens
 
 # Global state
 current_language = 'english'
-is_reading_news = False
-is_paused_for_question = False
 last_read_position = ""
 
+# Cross-thread reading state, shared by Socket.IO handlers and the reader thread
+reading_evt = threading.Event()   # News broadcast is active
+paused_evt = threading.Event()    # Broadcast paused for a viewer question
+cancel_evt = threading.Event()    # Current speech should stop
+resume_evt = threading.Event()    # Wakes the paused reader (resume or stop)
+
 class NewsAnchorAI:
     def __init__(self):
         print("📺 News Anchor AI starting...")
@@ -56,6 +174,13 @@ class NewsAnchorAI:
         
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = True
+        self.phrases = queue.Queue()  # Transcripts from the background listener
+        self.speaking = threading.Event()  # Set while speak() is playing audio
+        self.spoken_pairs = frozenset()    # Word pairs of the current (or last) speech, for echo checks
+        
+        # Local ASR - the Whisper model is loaded on first use; the web UI never needs it
+        self.asr = None
+        self.asr_ready = False
         
         # AI
         self.setup_ai()
@@ -63,8 +188,61 @@ class NewsAnchorAI:
         # Edge TTS voices
         self.setup_edge_voices()
         
+        # Open the audio device now so the first sentence doesn't pay for it
+        self.warm_up_audio()
+        
+        # One long-lived event loop for Edge TTS instead of asyncio.run per sentence
+        self.tts_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.tts_loop.run_forever, daemon=True, name='edge-tts-loop').start()
+        
+        # Audio being synthesized ahead of playback: (voice, text) -> Future of MP3 bytes
+        # Reentrant: a future's done callback can run in the thread that cancels it
+        self.prefetched = {}                  # Whole-document pre-render
+        self.prefetched_next = OrderedDict()  # Next-sentence prefetch, capped separately
+        self.prefetch_lock = threading.RLock()
+        self.prerender_semaphore = None  # Created on the TTS loop thread on first use
+        
+        # Wake event of the current speak() call; interrupt() sets it so a cancel is seen at once
+        self.speech_wake = threading.Event()
+        
+        # Finished MP3 bytes by content hash, backed by TTS_CACHE_DIR
+        self.audio_cache = OrderedDict()
+        self.audio_cache_lock = threading.Lock()
+        self.disk_cache_lock = threading.Lock()
+        self.disk_cache_bytes = sum(size for _, size, _ in self.disk_cache_files())
+        self.preload_common_phrases()
+        
         print("✅ News Anchor AI ready!")
         
+    def setup_asr(self):
+        """Load the local Whisper model (int8 on CPU) if faster-whisper is available"""
+        self.asr = None
+        self.asr_ready = True
+        if WhisperModel is None:
+            print("⚠️ faster-whisper not installed - using Google speech recognition")
+            return
+        try:
+            self.asr = WhisperModel(WHISPER_MODEL, device='cpu', compute_type='int8')
+            print(f"✅ Local speech recognition ready (Whisper {WHISPER_MODEL}, int8)")
+        except Exception as e:
+            logging.error(f"Whisper setup error: {e}")
+            print(f"⚠️ Whisper error: {e} - using Google speech recognition")
+    
+    def transcribe(self, audio):
+        """Transcribe captured audio locally with Whisper, or via Google as a fallback"""
+        if not self.asr_ready:
+            self.setup_asr()
+        if self.asr is None:
+            return self.recognizer.recognize_google(audio)
+        
+        pcm = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self.asr.transcribe(samples, vad_filter=True, beam_size=1)
+        text = ' '.join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
     def setup_ai(self):
         try:
             api_key = os.getenv('GOOGLE_API_KEY')
@@ -92,15 +270,8 @@ class NewsAnchorAI:
     def setup_edge_voices(self):
         """Initialize Edge TTS voices for all Indian languages - Energetic & Dynamic"""
         try:
-            # Voice mapping for Edge TTS (Microsoft)
-            # Using Indian female voices with natural, energetic delivery
-            self.edge_voices = {
-                'english': 'en-IN-NeerjaNeural',  # Indian English Female
-                'hindi': 'hi-IN-SwaraNeural',     # Hindi Female  
-                'marathi': 'mr-IN-AarohiNeural',  # Marathi Female
-                'tamil': 'ta-IN-PallaviNeural',   # Tamil Female
-                'telugu': 'te-IN-ShrutiNeural'    # Telugu Female
-            }
+            # Voice and prosody per language, indexed by LANG_IDX
+            self.edge_voices = VOICE_CFG
             print("✅ Edge TTS voices configured (Energetic & Dynamic)")
             print("   🇮🇳 English: Neerja")
             print("   🇮🇳 Hindi: Swara")
@@ -113,10 +284,228 @@ class NewsAnchorAI:
             self.edge_voices = None
             print(f"⚠️ Edge TTS error: {e}")
     
+    def warm_up_audio(self):
+        """Initialize PortAudio and the output device by playing 100ms of silence"""
+        try:
+            silence = np.zeros(TTS_SAMPLE_RATE // 10, dtype=np.int16)
+            sd.play(silence, samplerate=TTS_SAMPLE_RATE, blocking=True)
+            print("✅ Audio output ready")
+        except Exception as e:
+            logging.warning(f"Audio warm-up failed: {e}")
+    
+    def voice_config(self, language):
+        """(voice, rate, pitch, volume) for a language, English if unknown"""
+        return self.edge_voices[LANG_IDX.get(language, 0)]
+    
+    def audio_cache_key(self, voice_cfg, text):
+        """Content hash of everything that determines the synthesized audio"""
+        payload = f"{'|'.join(voice_cfg)}|{text}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def has_cached_audio(self, voice_cfg, text):
+        """True if text is already in the memory or disk cache, without loading it"""
+        key = self.audio_cache_key(voice_cfg, text)
+        with self.audio_cache_lock:
+            if key in self.audio_cache:
+                return True
+        return os.path.exists(os.path.join(TTS_CACHE_DIR, f"{key}.mp3"))
+    
+    def get_cached_audio(self, voice_cfg, text):
+        """MP3 bytes for text from the memory or disk cache, or None"""
+        key = self.audio_cache_key(voice_cfg, text)
+        with self.audio_cache_lock:
+            audio_bytes = self.audio_cache.get(key)
+            if audio_bytes is not None:
+                self.audio_cache.move_to_end(key)
+                return audio_bytes
+        
+        path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                audio_bytes = f.read()
+            os.utime(path)  # Mark as recently used for pruning
+        except OSError:
+            return None
+        self.remember_audio(key, audio_bytes)
+        return audio_bytes
+    
+    def remember_audio(self, key, audio_bytes):
+        """Put MP3 bytes in the in-memory LRU"""
+        with self.audio_cache_lock:
+            self.audio_cache[key] = audio_bytes
+            self.audio_cache.move_to_end(key)
+            while len(self.audio_cache) > TTS_MEMORY_CACHE_SIZE:
+                self.audio_cache.popitem(last=False)
+    
+    def store_audio(self, voice_cfg, text, audio_bytes):
+        """Cache synthesized MP3 bytes in memory and on disk"""
+        key = self.audio_cache_key(voice_cfg, text)
+        self.remember_audio(key, audio_bytes)
+        try:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(audio_bytes)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write TTS cache file: {e}")
+            return
+        
+        with self.disk_cache_lock:
+            self.disk_cache_bytes += len(audio_bytes)
+            if self.disk_cache_bytes > TTS_DISK_CACHE_MAX_MB * 1024 * 1024:
+                self.prune_disk_cache()
+    
+    def disk_cache_files(self):
+        """(mtime, size, path) of every MP3 in the disk cache"""
+        files = []
+        try:
+            with os.scandir(TTS_CACHE_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.mp3'):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return files
+    
+    def prune_disk_cache(self):
+        """Delete least recently used MP3s until the disk cache is back under its cap"""
+        # Caller holds disk_cache_lock; rescanning also corrects the running total
+        files = sorted(self.disk_cache_files())
+        total = sum(size for _, size, _ in files)
+        target = TTS_DISK_CACHE_MAX_MB * 1024 * 1024 * TTS_DISK_CACHE_PRUNE_TO
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self.disk_cache_bytes = total
+        print(f"🧹 Pruned {removed} cached speech files ({total / (1024 * 1024):.0f} MB kept)")
+    
+    def preload_common_phrases(self):
+        """Synthesize intros and continue prompts for every language in the background"""
+        if not self.edge_voices:
+            return
+        for language, voice_cfg in zip(LANGUAGES, self.edge_voices):
+            phrases = [get_news_intro(language)]
+            if language in CONTINUE_PROMPTS:
+                phrases.append(CONTINUE_PROMPTS[language])
+            for text in phrases:
+                if self.get_cached_audio(voice_cfg, text) is None:
+                    asyncio.run_coroutine_threadsafe(self.generate_speech(text, voice_cfg), self.tts_loop)
+    
+    async def generate_speech(self, text, voice_cfg, check_cancelled=None):
+        """Synthesize text with Edge TTS and return the MP3 bytes, or None if cancelled"""
+        # Audio is streamed chunk by chunk so a cancel stops synthesis early
+        communicate = edge_tts.Communicate(text, **COMMUNICATE_KWARGS[voice_cfg])
+        audio_chunks = []
+        async for chunk in communicate.stream():
+            if check_cancelled and check_cancelled():
+                return None
+            if chunk["type"] == "audio":
+                audio_chunks.append(chunk["data"])
+        
+        audio_bytes = b"".join(audio_chunks)
+        self.store_audio(voice_cfg, text, audio_bytes)
+        return audio_bytes
+    
+    def prefetch(self, text, language='english'):
+        """Start synthesizing text in the background so a later speak() skips the Edge TTS wait"""
+        if not text or not self.edge_voices:
+            return
+        
+        voice_cfg = self.voice_config(language)
+        if self.get_cached_audio(voice_cfg, text) is not None:
+            return
+        
+        key = (voice_cfg, text)
+        with self.prefetch_lock:
+            if key in self.prefetched or key in self.prefetched_next:
+                return
+            # Keep at most two prefetched sentences in flight; pre-render work is never evicted here
+            while len(self.prefetched_next) >= 2:
+                self.prefetched_next.popitem(last=False)[1].cancel()
+            self.prefetched_next[key] = asyncio.run_coroutine_threadsafe(
+                self.generate_speech(text, voice_cfg), self.tts_loop
+            )
+    
+    async def generate_speech_limited(self, text, voice_cfg):
+        """generate_speech() bounded by the pre-render concurrency limit"""
+        if self.prerender_semaphore is None:
+            self.prerender_semaphore = asyncio.Semaphore(TTS_PRERENDER_CONCURRENCY)
+        async with self.prerender_semaphore:
+            return await self.generate_speech(text, voice_cfg)
+    
+    def prerender(self, texts, language='english'):
+        """Synthesize every sentence of the document concurrently, in reading order, ahead of playback"""
+        if not self.edge_voices:
+            return
+        
+        voice_cfg = self.voice_config(language)
+        submitted = 0
+        for text in texts:
+            key = (voice_cfg, text)
+            if self.has_cached_audio(voice_cfg, text):
+                continue
+            with self.prefetch_lock:
+                if key in self.prefetched:
+                    continue
+                future = asyncio.run_coroutine_threadsafe(
+                    self.generate_speech_limited(text, voice_cfg), self.tts_loop
+                )
+                self.prefetched[key] = future
+            # Finished audio lives in the speech cache, so the future needn't hold on to it
+            future.add_done_callback(lambda done, key=key: self.forget_prefetch(key, done))
+            submitted += 1
+        if submitted:
+            print(f"🎧 Pre-rendering {submitted} sentences in the background")
+    
+    def forget_prefetch(self, key, future):
+        """Drop a finished background future; speak() then reads the cache or synthesizes anew"""
+        with self.prefetch_lock:
+            if self.prefetched.get(key) is future:
+                del self.prefetched[key]
+    
+    def take_prefetched(self, voice_cfg, text):
+        """Remove and return the background future for text, if any"""
+        key = (voice_cfg, text)
+        with self.prefetch_lock:
+            future = self.prefetched.pop(key, None)
+            next_future = self.prefetched_next.pop(key, None)
+        return future if future is not None else next_future
+    
+    def clear_prefetch(self):
+        """Drop prefetched audio, e.g. after a language change or when reading stops"""
+        with self.prefetch_lock:
+            for future in [*self.prefetched.values(), *self.prefetched_next.values()]:
+                future.cancel()
+            self.prefetched.clear()
+            self.prefetched_next.clear()
+    
+    def interrupt(self):
+        """Wake a speak() waiting on playback so it re-checks its cancel condition now"""
+        self.speech_wake.set()
+    
     def speak(self, text, check_cancelled=None, language='english', session_id=None):
         """NEWS READING SPEECH - Professional News Anchor with Edge TTS (Natural Indian Female Voice)"""
         print(f"🗣️ Broadcasting: {text[:100]}...")
         
+        # A fresh event per call, so a late signal from an earlier speech cannot wake this one
+        wake = threading.Event()
+        self.speech_wake = wake
+        
         try:
             # Check if cancelled before starting
             if check_cancelled and check_cancelled():
@@ -128,155 +517,169 @@ class NewsAnchorAI:
                 return False
             
             # Select voice based on language
-            voice_name = self.edge_voices.get(language.lower(), self.edge_voices['english'])
+            voice_cfg = self.voice_config(language)
             
-            print(f"🎙️ Using Edge TTS: {voice_name}")
+            print(f"🎙️ Using Edge TTS: {voice_cfg[0]}")
             
-            # Use Edge TTS with direct import
-            try:
-                import pygame
-                from pydub import AudioSegment
-                import edge_tts
-                import asyncio
-                
-                # Create temp MP3 file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                    temp_file = fp.name
-                
-                # Generate speech with Edge TTS
-                # Energetic & animated with dynamic variations in pitch and tone
-                print(f"🔊 Generating energetic speech with {voice_name}...")
-                
-                # Run edge-tts async generation with prosody settings
-                # - Fast rate for exciting moments (+15%)
-                # - Higher pitch for enthusiasm (+5Hz)
-                # - Stronger volume for presence (+10%)
-                async def generate_speech():
-                    communicate = edge_tts.Communicate(
-                        text, 
-                        voice_name,
-                        rate='+15%',
-                        pitch='+5Hz',
-                        volume='+10%'
-                    )
-                    await communicate.save(temp_file)
-                
-                # Execute async function
-                asyncio.run(generate_speech())
-                
-                # Load audio and apply processing
-                audio = AudioSegment.from_mp3(temp_file)
-                
-                # Boost volume for stronger presence (+3dB)
-                audio = audio + 3
-                
-                # Apply gentle bass boost for deeper voice
-                audio = audio.low_pass_filter(3000).high_pass_filter(100)
-                
-                # Save processed audio
-                processed_file = temp_file.replace('.mp3', '_processed.mp3')
-                audio.export(processed_file, format="mp3", bitrate="128k")
-                
-                # Clean up original file
-                os.remove(temp_file)
-                temp_file = processed_file
-                
-                # Check cancellation
-                if check_cancelled and check_cancelled():
-                    print("🛑 Speech cancelled before playback")
-                    os.remove(temp_file)
-                    return False
-                
-                # Initialize pygame mixer
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init(frequency=24000, size=-16, channels=2, buffer=512)
-                
-                # Load and play audio
-                pygame.mixer.music.load(temp_file)
-                
-                # Signal frontend to start talk video RIGHT NOW
-                if session_id:
-                    socketio.emit('speech_started', {}, room=session_id)
-                
-                # Play immediately with no delay
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    if check_cancelled and check_cancelled():
-                        print("🛑 Speech cancelled during playback")
-                        pygame.mixer.music.stop()
-                        pygame.mixer.music.unload()
-                        try:
-                            os.remove(temp_file)
-                        except:
-                            pass
-                        return False
-                    time.sleep(0.05)  # Reduced delay for better responsiveness
-                
-                # Signal frontend to switch to LISTENING VIDEO immediately
-                if session_id:
-                    socketio.emit('speech_ended', {}, room=session_id)
-                
-                # Unload music to free resources
-                pygame.mixer.music.unload()
-                
-                # Clean up
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
-                
-                print("✅ Speech completed")
-                return True
-                
-            except ImportError as e:
-                print(f"⚠️ TTS library error: {e}")
+            # Use cached or prefetched audio when available, else synthesize now
+            audio_bytes = self.get_cached_audio(voice_cfg, text)
+            if audio_bytes is not None:
+                print("⚡ Using cached speech")
+                self.take_prefetched(voice_cfg, text)
+            else:
+                future = self.take_prefetched(voice_cfg, text)
+                if future is not None:
+                    print("⚡ Using prefetched speech")
+                    try:
+                        audio_bytes = future.result()
+                    except Exception as e:
+                        # Throttled, failed or cancelled in the background - synthesize it here instead
+                        print(f"⚠️ Background speech unavailable ({e!r}), generating now")
+                if audio_bytes is None:
+                    # Generate speech with Edge TTS
+                    # Energetic & animated with dynamic variations in pitch and tone
+                    print(f"🔊 Generating energetic speech with {voice_cfg[0]}...")
+                    audio_bytes = asyncio.run_coroutine_threadsafe(
+                        self.generate_speech(text, voice_cfg, check_cancelled), self.tts_loop
+                    ).result()
+            if audio_bytes is None:
+                print("🛑 Speech cancelled during synthesis")
                 return False
             
+            # Check cancellation
+            if check_cancelled and check_cancelled():
+                print("🛑 Speech cancelled before playback")
+                return False
+            
+            # Decode the MP3 once to 16-bit mono PCM and play it directly through the OS device
+            decoded = miniaudio.decode(
+                audio_bytes,
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=TTS_CHANNELS,
+                sample_rate=TTS_SAMPLE_RATE
+            )
+            samples = np.frombuffer(decoded.samples, dtype=np.int16)
+            position = 0
+            playback_done = threading.Event()
+            
+            def fill_buffer(outdata, frames, time_info, status):
+                nonlocal position
+                chunk = samples[position:position + frames]
+                outdata[:len(chunk), 0] = chunk
+                position += len(chunk)
+                if len(chunk) < frames:
+                    outdata[len(chunk):] = 0
+                    raise sd.CallbackStop
+            
+            def on_finished():
+                playback_done.set()
+                wake.set()  # Wake the wait below
+            
+            stream = sd.OutputStream(
+                samplerate=TTS_SAMPLE_RATE,
+                channels=TTS_CHANNELS,
+                dtype='int16',
+                callback=fill_buffer,
+                finished_callback=on_finished
+            )
+            
+            # Signal frontend to start talk video RIGHT NOW
+            if session_id:
+                socketio.emit('speech_started', {}, room=session_id)
+            
+            # Play immediately with no delay
+            self.spoken_pairs = word_pairs(text)
+            self.speaking.set()
+            try:
+                with stream:
+                    # Sleep until playback finishes or interrupt() fires - no polling
+                    while not playback_done.is_set():
+                        if check_cancelled and check_cancelled():
+                            print("🛑 Speech cancelled during playback")
+                            stream.abort()
+                            return False
+                        wake.wait(timeout=1.0)
+                        wake.clear()
+            finally:
+                self.speaking.clear()
+            
+            # Signal frontend to switch to LISTENING VIDEO immediately
+            if session_id:
+                socketio.emit('speech_ended', {}, room=session_id)
+            
+            print("✅ Speech completed")
+            return True
+            
         except Exception as e:
             print(f"❌ TTS error: {e}")
             import traceback
             traceback.print_exc()
             return False
     
-    def listen(self):
-        """Listen for user speech"""
+    def calibrate_microphone(self):
+        """Load the saved energy threshold, or measure ambient noise once and save it"""
         try:
-            print("🎤 Listening...")
+            with open(MIC_CALIBRATION_PATH) as f:
+                self.recognizer.energy_threshold = float(json.load(f)['energy_threshold'])
+            print(f"✅ Threshold (saved): {self.recognizer.energy_threshold}")
+        except (OSError, ValueError, KeyError, TypeError):
+            print("🎤 Calibrating microphone...")
             with self.microphone as source:
-                audio = self.recognizer.listen(source, timeout=3, phrase_time_limit=8)
-            
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+            print(f"✅ Threshold: {self.recognizer.energy_threshold}")
+            try:
+                os.makedirs(os.path.dirname(MIC_CALIBRATION_PATH) or '.', exist_ok=True)
+                with open(MIC_CALIBRATION_PATH, 'w') as f:
+                    json.dump({'energy_threshold': self.recognizer.energy_threshold}, f)
+            except OSError as e:
+                logging.warning(f"Could not save microphone calibration: {e}")
+        
+        # Threshold is fixed from here on - skip per-listen RMS re-estimation
+        self.recognizer.dynamic_energy_threshold = False
+    
+    def _on_phrase(self, recognizer, audio):
+        """Background listener callback: queue the transcript, barging in if the anchor is speaking"""
+        try:
             print("🔄 Processing...")
-            text = self.recognizer.recognize_google(audio)
-            print(f"👤 You: {text}")
-            return text
-            
-        except sr.WaitTimeoutError:
-            return None
+            text = self.transcribe(audio)
         except sr.UnknownValueError:
             print("🔇 Didn't understand")
-            return None
+            return
         except Exception as e:
             print(f"❌ Listen error: {e}")
-            return None
+            return
+        
+        if not text:
+            return
+        if self.is_echo(text):
+            print(f"🔁 Ignoring own speech: {text}")
+            return
+        print(f"👤 You: {text}")
+        self.phrases.put(text)
+        
+        # Barge-in: cut off the current speech so the new phrase is answered next
+        if self.speaking.is_set():
+            cancel_evt.set()
+            self.interrupt()
+    
+    def is_echo(self, text):
+        """True if a transcript is mostly the anchor's current (or just finished) speech"""
+        # Word pairs rather than single words, so a question that reuses the answer's vocabulary still counts
+        pairs = word_pairs(text)
+        if not pairs or not self.spoken_pairs:
+            return False
+        return len(pairs & self.spoken_pairs) >= ECHO_OVERLAP * len(pairs)
     
     def get_response(self, user_input):
         """Get AI response using RAG from PDF - News Anchor Style"""
         if not user_input:
             return "I didn't catch that. Could you please repeat your question?"
         
-        user_lower = user_input.lower()
-        
-        # Handle greetings with news anchor personality
-        if any(word in user_lower for word in ['hello', 'hi', 'hey', 'good morning', 'good evening']):
-            return "Good evening! Welcome to the news desk. I'm here to help you with information from official documents. What would you like to know today?"
-        
-        if any(word in user_lower for word in ['thank', 'thanks']):
-            return "You're very welcome! I'm here if you need any more information. Have a great day!"
-        
-        if any(word in user_lower for word in ['bye', 'goodbye', 'see you']):
-            return "Thank you for tuning in! Stay informed and have a wonderful day ahead!"
+        # Handle greetings, thanks and goodbyes with news anchor personality
+        tokens = tokenize(user_input)
+        for phrases, reply in INTENT_RESPONSES:
+            if tokens & phrases:
+                return reply
         
         # Use RAG system to answer from PDF
         try:
@@ -296,33 +699,42 @@ class NewsAnchorAI:
         # Initial greeting with news anchor style
         self.speak("Good evening! Welcome to the news desk. I'm here to help you with information from official documents. What would you like to know today?")
         
-        # Calibrate microphone
-        print("🎤 Calibrating microphone...")
-        with self.microphone as source:
-            self.recognizer.adjust_for_ambient_noise(source, duration=1)
-        print(f"✅ Threshold: {self.recognizer.energy_threshold}")
+        # Calibrate microphone and load speech recognition before the first question
+        self.calibrate_microphone()
+        if not self.asr_ready:
+            self.setup_asr()
+        
+        # Capture in the background so the user can talk over a response
+        print("🎤 Listening...")
+        self._stop = self.recognizer.listen_in_background(self.microphone, self._on_phrase, phrase_time_limit=8)
         
         # Main conversation loop
-        while True:
-            try:
-                # Listen for user input
-                user_input = self.listen()
-                
-                if user_input:
+        try:
+            while True:
+                try:
+                    # Wait for the next transcript from the listener
+                    try:
+                        user_input = self.phrases.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    cancel_evt.clear()
+                    
                     # Check for exit command
-                    if any(word in user_input.lower() for word in ['stop', 'quit', 'exit', 'goodbye']):
+                    if tokenize(user_input) & EXIT_WORDS:
                         self.speak("Goodbye, Sir. It was a pleasure serving you.")
                         break
                     
-                    # Get and speak response
+                    # Get and speak response; a newer phrase cancels it
                     response = self.get_response(user_input)
-                    self.speak(response)
-                
-            except KeyboardInterrupt:
-                self.speak("Goodbye, Sir.")
-                break
-            except Exception as e:
-                print(f"❌ Error: {e}")
+                    self.speak(response, check_cancelled=cancel_evt.is_set)
+                    
+                except KeyboardInterrupt:
+                    self.speak("Goodbye, Sir.")
+                    break
+                except Exception as e:
+                    print(f"❌ Error: {e}")
+        finally:
+            self._stop(wait_for_stop=False)
 
 # Global News Anchor instance
 news_anchor = None
@@ -350,12 +762,15 @@ def handle_set_language(data):
     global current_language
     from rag_system import news_system, initialize_rag
     
-    new_language = data.get('language', 'english')
+    new_language = data.get('language', 'english').lower()
     
     if new_language != current_language:
         current_language = new_language
         print(f'🌍 Language changed to: {current_language}')
         
+        if news_anchor:
+            news_anchor.clear_prefetch()
+        
         # Reinitialize RAG system with new language
         try:
             print(f'📚 Reloading document for {current_language}...')
@@ -376,32 +791,33 @@ def handle_set_language(data):
 @socketio.on('start_reading')
 def handle_start_reading():
     """Start reading news from beginning"""
-    global is_reading_news, is_paused_for_question, speech_cancelled
-    
-    is_reading_news = True
-    is_paused_for_question = False
-    speech_cancelled = False
+    reading_evt.set()
+    paused_evt.clear()
+    cancel_evt.clear()
+    resume_evt.set()
     reset_reading()
     
     session_id = request.sid
     print(f'📰 Starting news broadcast for {session_id}')
     
     def read_news_continuously():
-        global is_reading_news, is_paused_for_question, speech_cancelled
+        # Render the whole document in the background so reading is mostly pure playback
+        if news_anchor:
+            news_anchor.prerender(get_all_sentences(), language=current_language)
         
         # Send intro
         intro = get_news_intro(current_language)
         socketio.emit('news_intro', {'message': intro}, room=session_id)
         
-        if news_anchor and not speech_cancelled:
-            news_anchor.speak(intro, check_cancelled=lambda: speech_cancelled, language=current_language, session_id=session_id)
+        if news_anchor and not cancel_evt.is_set():
+            news_anchor.speak(intro, check_cancelled=cancel_evt.is_set, language=current_language, session_id=session_id)
         
         # Read news continuously
-        while is_reading_news:
-            # Wait while paused for question
-            if is_paused_for_question or speech_cancelled:
-                print(f'⏸️ Loop paused - is_paused: {is_paused_for_question}, cancelled: {speech_cancelled}')
-                time.sleep(0.1)  # Very short check for instant resume
+        while reading_evt.is_set():
+            # Block while paused for question - handlers set resume_evt to wake us
+            if paused_evt.is_set() or cancel_evt.is_set():
+                print(f'⏸️ Loop paused - is_paused: {paused_evt.is_set()}, cancelled: {cancel_evt.is_set()}')
+                resume_evt.wait()
                 continue
             
             sentence, has_more = get_next_sentence()
@@ -414,42 +830,45 @@ def handle_start_reading():
                     'progress': get_progress()
                 }, room=session_id)
                 
+                # Synthesize the following sentence while this one plays
+                if news_anchor and has_more:
+                    news_anchor.prefetch(peek_next_sentence(), language=current_language)
+                
                 # Speak sentence immediately
-                if news_anchor and not speech_cancelled:
-                    news_anchor.speak(sentence, check_cancelled=lambda: speech_cancelled or is_paused_for_question, language=current_language, session_id=session_id)
+                if news_anchor and not cancel_evt.is_set():
+                    news_anchor.speak(sentence, check_cancelled=lambda: cancel_evt.is_set() or paused_evt.is_set(), language=current_language, session_id=session_id)
                 
                 # Check if paused during speech
-                if is_paused_for_question or speech_cancelled:
+                if paused_evt.is_set() or cancel_evt.is_set():
                     print('⏸️ Paused during speech, waiting...')
                     continue
             
             if not has_more:
                 # News finished
                 socketio.emit('news_completed', {}, room=session_id)
-                is_reading_news = False
+                reading_evt.clear()
                 break
         
         print('✅ News reading completed or stopped')
     
-    threading.Thread(target=read_news_continuously, daemon=True).start()
-    emit('reading_started', {'status': 'broadcasting'})
+    socketio.start_background_task(read_news_continuously)
+    emit('reading_state', {'state': 'broadcasting'})
 
 @socketio.on('ask_question')
 def handle_ask_question():
     """Pause news and enable question mode"""
-    global is_paused_for_question, speech_cancelled
-    
-    is_paused_for_question = True
-    speech_cancelled = True  # Stop current speech
+    resume_evt.clear()
+    paused_evt.set()
+    cancel_evt.set()  # Stop current speech
+    if news_anchor:
+        news_anchor.interrupt()
     
     print('⏸️ News paused for question')
-    emit('question_mode_enabled', {'status': 'paused'})
+    emit('reading_state', {'state': 'paused'})
 
 @socketio.on('user_question')
 def handle_user_question(data):
     """Handle user question during news reading"""
-    global is_paused_for_question, speech_cancelled
-    
     question = data.get('question', '').strip()
     session_id = request.sid
     
@@ -467,71 +886,57 @@ def handle_user_question(data):
     
     # Speak answer with news anchor style
     if news_anchor:
-        speech_cancelled = False
-        news_anchor.speak(answer, check_cancelled=lambda: speech_cancelled, language=current_language, session_id=session_id)
+        cancel_evt.clear()
+        news_anchor.speak(answer, check_cancelled=cancel_evt.is_set, language=current_language, session_id=session_id)
     
     # Always ask if user wants to continue
-    continue_prompts = {
-        'english': 'Can we continue with the news?',
-        'hindi': 'क्या हम समाचार जारी रखें?',
-        'marathi': 'आम्ही बातम्या सुरू ठेवू का?'
-    }
-    
-    prompt = continue_prompts.get(current_language, continue_prompts['english'])
+    prompt = CONTINUE_PROMPTS.get(current_language, CONTINUE_PROMPTS['english'])
     socketio.emit('ask_continue', {'message': prompt}, room=session_id)
     
     if news_anchor:
-        news_anchor.speak(prompt, check_cancelled=lambda: speech_cancelled, language=current_language, session_id=session_id)
+        news_anchor.speak(prompt, check_cancelled=cancel_evt.is_set, language=current_language, session_id=session_id)
 
 @socketio.on('continue_reading')
 def handle_continue_reading(data):
     """Resume news reading after question"""
-    global is_paused_for_question, speech_cancelled, is_reading_news
-    
     user_response = data.get('response', '').lower()
     
     print(f'▶️ Continue reading request received: {user_response}')
     
     # Clear all pause flags to resume reading
-    is_paused_for_question = False
-    speech_cancelled = False
-    is_reading_news = True  # Ensure reading is still active
+    paused_evt.clear()
+    cancel_evt.clear()
+    reading_evt.set()  # Ensure reading is still active
+    resume_evt.set()   # Wake the reader thread immediately
     
-    print(f'✅ Flags reset - is_paused: {is_paused_for_question}, cancelled: {speech_cancelled}, reading: {is_reading_news}')
+    print(f'✅ Flags reset - is_paused: {paused_evt.is_set()}, cancelled: {cancel_evt.is_set()}, reading: {reading_evt.is_set()}')
     print('▶️ News should resume now...')
     
-    emit('reading_resumed', {'status': 'continuing'}, broadcast=False)
-    emit('reading_started', {'status': 'broadcasting'}, broadcast=False)  # Re-activate reading UI state
+    emit('reading_state', {'state': 'resumed'})
 
 @socketio.on('stop_reading')
 def handle_stop_reading():
     """Stop news reading completely"""
-    global is_reading_news, speech_cancelled
-    
-    is_reading_news = False
-    speech_cancelled = True
+    reading_evt.clear()
+    cancel_evt.set()
+    resume_evt.set()  # Let a paused reader exit
     
-    # Stop and cleanup pygame to allow restart
-    try:
-        import pygame
-        if pygame.mixer.get_init():
-            pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-    except:
-        pass
+    if news_anchor:
+        news_anchor.interrupt()
+        news_anchor.clear_prefetch()
     
     print('🛑 News reading stopped')
-    emit('reading_stopped', {'status': 'stopped'})
-
-# Global flag to cancel speech
-speech_cancelled = False
+    emit('reading_state', {'state': 'stopped'})
 
 @socketio.on('cancel_session')
 def handle_cancel_session():
     """Handle session cancellation"""
-    global speech_cancelled, is_reading_news
-    speech_cancelled = True
-    is_reading_news = False
+    cancel_evt.set()
+    reading_evt.clear()
+    resume_evt.set()  # Let a paused reader exit
+    if news_anchor:
+        news_anchor.interrupt()
+        news_anchor.clear_prefetch()
     print('🛑 Session cancelled')
 
 def run_web_server():